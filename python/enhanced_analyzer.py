@@ -164,22 +164,28 @@ class EnhancedResumeAnalyzer:
 
     def analyze_resume(self, text, metadata=None):
         """Perform comprehensive resume analysis"""
+        # Lowercase and split the text once; the per-criterion analyzers
+        # below all accept these precomputed views so a full analysis
+        # doesn't rescan the raw text a dozen times
+        text_lower = text.lower()
+        lines = text.split('\n')
+
         analysis = {
-            'sections': self.analyze_sections(text),
+            'sections': self.analyze_sections(text, lines=lines, text_lower=text_lower),
             'readability': self.analyze_readability(text),
-            'writing_quality': self.analyze_writing_quality(text),
+            'writing_quality': self.analyze_writing_quality(text, text_lower=text_lower),
             'action_verbs': self.analyze_action_verbs(text),
             'quantification': self.analyze_quantification_enhanced(text),  # Enhanced version
-            'skills_analysis': self.analyze_skills_enhanced(text),  # Enhanced version
-            'chronology': self.analyze_chronology_enhanced(text),  # Enhanced version
-            'summary_analysis': self.analyze_summary_quality(text),  # New
-            'buzzwords_analysis': self.analyze_buzzwords(text),  # New
+            'skills_analysis': self.analyze_skills_enhanced(text, text_lower=text_lower, lines=lines),  # Enhanced version
+            'chronology': self.analyze_chronology_enhanced(text, lines=lines),  # Enhanced version
+            'summary_analysis': self.analyze_summary_quality(text, lines=lines),  # New
+            'buzzwords_analysis': self.analyze_buzzwords(text, text_lower=text_lower),  # New
             'impact_analysis': self.analyze_impact_metrics(text),  # New
             'date_consistency': self.analyze_date_consistency(text),  # New
-            'unnecessary_sections': self.analyze_unnecessary_sections(text),  # New
+            'unnecessary_sections': self.analyze_unnecessary_sections(text, lines=lines, text_lower=text_lower),  # New
             'entities': self.extract_entities(text),
-            'tone_analysis': self.analyze_tone(text),
-            'formatting': self.analyze_formatting(text),
+            'tone_analysis': self.analyze_tone(text, text_lower=text_lower),
+            'formatting': self.analyze_formatting(text, lines=lines),
             'final_score': {}
         }
         
@@ -241,9 +247,11 @@ class EnhancedResumeAnalyzer:
         
         return detected_headers  # Return list of explicitly detected section headers
 
-    def analyze_sections(self, text):
+    def analyze_sections(self, text, lines=None, text_lower=None):
         """Analyze section completeness and order"""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        if lines is None:
+            lines = text.split('\n')
+        lines = [line.strip() for line in lines if line.strip()]
         detected_sections = []
         section_positions = {}
         
@@ -273,7 +281,7 @@ class EnhancedResumeAnalyzer:
                     break
         
         # Infer other sections from content keywords
-        full_text = text.lower()
+        full_text = text.lower() if text_lower is None else text_lower
         
         # Education indicators
         if 'education' not in detected_sections:
@@ -485,12 +493,13 @@ class EnhancedResumeAnalyzer:
         
         return recommendations
 
-    def analyze_writing_quality(self, text):
+    def analyze_writing_quality(self, text, text_lower=None):
         """Analyze grammar, spelling, and professional tone"""
         issues = []
-        
+
         # Check for informal words
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         informal_found = [word for word in self.informal_words if word in text_lower]
         
         # Check for vague phrases
@@ -879,15 +888,18 @@ class EnhancedResumeAnalyzer:
         
         return entities
 
-    def analyze_tone(self, text):
+    def analyze_tone(self, text, text_lower=None):
         """Analyze tone and professionalism"""
+        if text_lower is None:
+            text_lower = text.lower()
+
         # Check for emotional language
         emotional_words = ['amazing', 'incredible', 'fantastic', 'terrible', 'awful', 'hate', 'love']
-        emotional_found = [word for word in emotional_words if word in text.lower()]
-        
+        emotional_found = [word for word in emotional_words if word in text_lower]
+
         # Check confidence indicators
         confidence_words = ['achieved', 'accomplished', 'delivered', 'exceeded', 'successful']
-        confidence_found = [word for word in confidence_words if word in text.lower()]
+        confidence_found = [word for word in confidence_words if word in text_lower]
         
         return {
             'emotional_language': emotional_found,
@@ -907,9 +919,10 @@ class EnhancedResumeAnalyzer:
         
         return max(min(score, 100), 0)
 
-    def analyze_formatting(self, text):
+    def analyze_formatting(self, text, lines=None):
         """Analyze formatting consistency"""
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.split('\n')
         
         # Check bullet consistency
         bullet_styles = []
@@ -1028,10 +1041,12 @@ class EnhancedResumeAnalyzer:
             'missing_patterns': [p for p in self.impact_patterns.keys() if p not in pattern_counts]
         }
 
-    def analyze_summary_quality(self, text):
+    def analyze_summary_quality(self, text, lines=None):
         """Analyze professional summary/objective quality"""
         # Split text into non-empty, stripped lines
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        if lines is None:
+            lines = text.split('\n')
+        lines = [line.strip() for line in lines if line.strip()]
         
         # Find summary section by looking for an explicit header first
         summary_start = -1  # Index where summary starts
@@ -1161,9 +1176,10 @@ class EnhancedResumeAnalyzer:
         
         return recommendations
 
-    def analyze_buzzwords(self, text):
+    def analyze_buzzwords(self, text, text_lower=None):
         """Detect and analyze buzzword usage with severity levels"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         found_buzzwords = []
         total_penalty = 0
         
@@ -1272,7 +1288,7 @@ class EnhancedResumeAnalyzer:
         
         return recommendations
 
-    def analyze_skills_enhanced(self, text):
+    def analyze_skills_enhanced(self, text, text_lower=None, lines=None):
         """Enhanced skills analysis with categorization and relevance checking"""
         # Enhanced skill patterns with more comprehensive lists
         technical_skills = {
@@ -1289,7 +1305,8 @@ class EnhancedResumeAnalyzer:
         ]
         
         # Extract skills from text
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         found_skills = {
             'programming': [],
             'web_technologies': [],
@@ -1311,7 +1328,7 @@ class EnhancedResumeAnalyzer:
                 found_skills['soft_skills'].append(skill)
         
         # Detect skill section quality
-        skills_section_analysis = self.analyze_skills_section_format(text)
+        skills_section_analysis = self.analyze_skills_section_format(text, lines=lines)
         
         # Check for irrelevant or outdated skills
         outdated_skills = ['internet explorer', 'flash', 'silverlight', 'windows 95', 'dos']
@@ -1327,9 +1344,10 @@ class EnhancedResumeAnalyzer:
             'recommendations': self.generate_enhanced_skills_recommendations(found_skills, outdated_found)
         }
 
-    def analyze_skills_section_format(self, text):
+    def analyze_skills_section_format(self, text, lines=None):
         """Analyze how skills are formatted and organized"""
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.split('\n')
         skills_section_found = False
         skills_lines = []
         
@@ -1433,7 +1451,7 @@ class EnhancedResumeAnalyzer:
         
         return recommendations
 
-    def analyze_chronology_enhanced(self, text):
+    def analyze_chronology_enhanced(self, text, lines=None):
         """Enhanced chronological analysis with detailed date checking"""
         # Extract all date ranges from text
         date_ranges = []
@@ -1457,7 +1475,7 @@ class EnhancedResumeAnalyzer:
                 'date_formats_used': [],
                 'format_consistency': False,
                 'consistency_issues': ['No dates found on resume'],
-                'missing_dates': self.check_missing_dates(text),
+                'missing_dates': self.check_missing_dates(text, lines=lines),
                 'chronological_order_issues': ['Cannot verify date order - no dates detected'],
                 'has_dates': False,
                 'recommendations': [
@@ -1477,7 +1495,7 @@ class EnhancedResumeAnalyzer:
             consistency_issues.append(f'Multiple date formats used: {", ".join(date_formats)}')
         
         # Check for missing dates in experience/education sections
-        missing_dates = self.check_missing_dates(text)
+        missing_dates = self.check_missing_dates(text, lines=lines)
         
         # Detect chronological order issues
         order_issues = self.check_chronological_order(date_ranges)
@@ -1505,9 +1523,10 @@ class EnhancedResumeAnalyzer:
         else:
             return 'Other'
 
-    def check_missing_dates(self, text):
+    def check_missing_dates(self, text, lines=None):
         """Check for entries that might be missing dates"""
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.split('\n')
         missing_dates = []
         
         # Look for job titles or company names without associated dates
@@ -1656,9 +1675,11 @@ class EnhancedResumeAnalyzer:
         
         return recommendations
 
-    def analyze_unnecessary_sections(self, text):
+    def analyze_unnecessary_sections(self, text, lines=None, text_lower=None):
         """Analyze for outdated/unnecessary resume sections"""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        if lines is None:
+            lines = text.split('\n')
+        lines = [line.strip() for line in lines if line.strip()]
         
         # Define outdated sections to detect
         outdated_sections = {
@@ -1696,8 +1717,9 @@ class EnhancedResumeAnalyzer:
         
         found_sections = []
         passed_checks = []
-        
-        text_lower = text.lower()
+
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Check each outdated section type
         for section_type, config in outdated_sections.items():
@@ -2198,16 +2220,21 @@ class EnhancedResumeAnalyzer:
         }
         
         scores = {}
-        
+
+        # Cache structures that are consulted by several criteria below
+        dates_analysis = analysis['chronology']
+        chron_issue_count = len(dates_analysis.get('chronological_order_issues') or ())
+        sections = analysis['sections']
+        missing_count = len(sections['missing_required'])
+
         # 1. Quantify Impact score
         quant_percentage = analysis['quantification']['quantification_percentage']
         scores['quantify_impact'] = min(quant_percentage * 2, 100)  # Scale 0-50% to 0-100
-        
+
         # 2. Dates score
-        dates_analysis = analysis['chronology']
         if dates_analysis.get('has_dates') == False:
             scores['dates'] = 0
-        elif dates_analysis.get('format_consistency', True) and not dates_analysis.get('chronological_order_issues', []):
+        elif dates_analysis.get('format_consistency', True) and not chron_issue_count:
             scores['dates'] = 100
         elif dates_analysis.get('format_consistency', True):
             scores['dates'] = 60
@@ -2232,9 +2259,8 @@ class EnhancedResumeAnalyzer:
         scores['skills_section'] = min(total_skills * 6, 100)  # 6 points per skill, max 100
         
         # 7. Structure score
-        sections = analysis['sections']
         structure_score = 100
-        structure_score -= len(sections['missing_required']) * 20  # 20 points per missing required section
+        structure_score -= missing_count * 20  # 20 points per missing required section
         structure_score -= len(sections['duplicated_sections']) * 10  # 10 points per duplicate
         structure_score -= 15 if not sections['order_analysis']['is_logical'] else 0
         scores['structure'] = max(structure_score, 0)
@@ -2243,14 +2269,13 @@ class EnhancedResumeAnalyzer:
         formatting_analysis = analysis['formatting']
         readability_score = analysis['readability']['flesch_score']
         buzzword_count = analysis['buzzwords_analysis']['total_buzzwords']
-        missing_sections = len(sections['missing_required'])
-        
+
         # Calculate ATS score based on multiple factors
         ats_factors = []
         ats_factors.append(min(formatting_analysis['formatting_score'], 100))
         ats_factors.append(min(max(readability_score, 0), 100))
         ats_factors.append(max(100 - (buzzword_count * 10), 0))
-        ats_factors.append(max(100 - (missing_sections * 25), 0))
+        ats_factors.append(max(100 - (missing_count * 25), 0))
         scores['ats_compatibility'] = sum(ats_factors) / len(ats_factors)
         
         # 9. Writing Quality score
@@ -2264,8 +2289,7 @@ class EnhancedResumeAnalyzer:
         scores['formatting'] = analysis['formatting']['formatting_score']
         
         # 12. Chronology score
-        chronology_issues = len(analysis['chronology'].get('chronological_order_issues', []))
-        scores['chronology'] = max(100 - (chronology_issues * 15), 0)
+        scores['chronology'] = max(100 - (chron_issue_count * 15), 0)
         
         # 13. Unnecessary Sections score
         unnecessary_sections_analysis = analysis['unnecessary_sections']
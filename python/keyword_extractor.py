@@ -22,34 +22,44 @@ SOFT_SKILLS = {
     'creative', 'organized', 'detail-oriented', 'collaborative', 'adaptable'
 }
 
+DEGREE_PATTERNS = ('bachelor', 'master', 'phd', 'mba', 'bs', 'ms', 'ba', 'ma')
+
+def _build_keyword_pattern():
+    """Build one alternation matching every keyword category in a single scan.
+
+    Degrees are \\b-anchored so short ones like 'ms' or 'ma' no longer match
+    inside words such as 'programs' or 'performance'. Longer alternatives are
+    listed first so multi-word keywords win over their substrings.
+    """
+    tech = '|'.join(sorted((re.escape(k) for k in TECH_KEYWORDS), key=len, reverse=True))
+    soft = '|'.join(sorted((re.escape(s) for s in SOFT_SKILLS), key=len, reverse=True))
+    deg = '|'.join(DEGREE_PATTERNS)
+    return re.compile(rf'(?P<tech>{tech})|(?P<soft>{soft})|(?P<deg>\b(?:{deg})\b)')
+
+_KEYWORD_RE = _build_keyword_pattern()
+
+_EXPERIENCE_RE = re.compile(r'(\d+)\+?\s*(years?|yrs?)')
+
 def extract_keywords(text):
     """Extract keywords from text"""
     text_lower = text.lower()
-    
-    # Extract tech keywords
+
+    # One pass over the text finds tech keywords, soft skills, and degrees
     tech_found = []
-    for keyword in TECH_KEYWORDS:
-        if keyword in text_lower:
-            tech_found.append(keyword)
-    
-    # Extract soft skills
     skills_found = []
-    for skill in SOFT_SKILLS:
-        if skill in text_lower:
-            skills_found.append(skill)
-    
+    degrees = []
+    buckets = {'tech': tech_found, 'soft': skills_found, 'deg': degrees}
+    seen = set()
+    for match in _KEYWORD_RE.finditer(text_lower):
+        keyword = match.group()
+        if keyword not in seen:
+            seen.add(keyword)
+            buckets[match.lastgroup].append(keyword)
+
     # Extract years of experience
-    exp_pattern = r'(\d+)\+?\s*(years?|yrs?)'
-    exp_matches = re.findall(exp_pattern, text_lower)
+    exp_matches = _EXPERIENCE_RE.findall(text_lower)
     experience_years = [int(match[0]) for match in exp_matches]
-    
-    # Extract degree/education
-    degrees = []
-    degree_patterns = ['bachelor', 'master', 'phd', 'mba', 'bs', 'ms', 'ba', 'ma']
-    for degree in degree_patterns:
-        if degree in text_lower:
-            degrees.append(degree)
-    
+
     return {
         'success': True,
         'technical_skills': tech_found,
@@ -4,6 +4,17 @@ NLP Analyzer - Traditional NLP detection for resume analysis
 """
 import re
 import json
+from bisect import bisect_right
+from functools import lru_cache
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 # Strong action verbs list
 STRONG_ACTION_VERBS = {
@@ -21,94 +32,144 @@ WEAK_ACTION_VERBS = {
     'assisted', 'tried', 'attempted', 'helped', 'supported'
 }
 
+# Strong verbs bucketed by first letter: most bullets don't start with a
+# strong verb, and a missing bucket rejects them on a one-char key
+_VERBS_BY_CHAR = {
+    char: frozenset(v for v in STRONG_ACTION_VERBS if v[0] == char)
+    for char in {v[0] for v in STRONG_ACTION_VERBS}
+}
+
+# Frozen for lookup speed, split by phrase length so check_action_verb only
+# joins and checks the n-grams that can actually match
+_WEAK_SINGLE = frozenset(v for v in WEAK_ACTION_VERBS if ' ' not in v)
+_WEAK_TWO = frozenset(v for v in WEAK_ACTION_VERBS if v.count(' ') == 1)
+_WEAK_THREE = frozenset(v for v in WEAK_ACTION_VERBS if v.count(' ') == 2)
+
+# Common typos (very basic check), scanned in one pass via _TYPO_RE; the
+# word boundaries keep typos from matching inside larger words
+COMMON_TYPOS = {
+    'recieve': 'receive',
+    'seperate': 'separate',
+    'occured': 'occurred',
+    'managment': 'management',
+    'sucessful': 'successful'
+}
+
+_TYPO_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, COMMON_TYPOS)) + r')\b', re.IGNORECASE)
+
+# Accepted sentence terminators for the end-of-bullet punctuation check
+_SENTENCE_END = ('.', '!', '?', ':')
+
 REQUIRED_SECTIONS = ['experience', 'skills', 'contact']
 CRITICAL_SECTIONS = ['experience', 'skills', 'contact']  # Must have all three for non-zero score
 
+# Bullet symbols and numbered lists fused into one pattern compiled at
+# import; lines are stripped before matching so no leading \s* is needed
+_BULLET_RE = re.compile(r'(?:[•\-\*]|\d+\.)\s+(.+)')
+
 def extract_bullet_points(text):
     """Extract bullet points from resume text"""
     bullets = []
-    
-    # Common bullet patterns
-    patterns = [
-        r'[•\-\*]\s+(.+)',  # Bullet symbols
-        r'^\s*[\d]+\.\s+(.+)',  # Numbered lists
-    ]
-    
-    for line in text.split('\n'):
+
+    for line in text.splitlines():
         line = line.strip()
         if not line:
             continue
-        
-        for pattern in patterns:
-            match = re.match(pattern, line)
-            if match:
-                bullets.append(match.group(1).strip())
-                break
-    
+
+        match = _BULLET_RE.match(line)
+        if match:
+            bullets.append(match.group(1).strip())
+
     return bullets
 
+# Quantifiable-metric patterns, folded into one alternation compiled at import
+# so has_quantification does a single scan instead of one per pattern
+_QUANT_PATTERNS = [
+    r'\d+%',  # Percentages
+    r'\$[\d,]+',  # Dollar amounts with commas
+    r'\d+\s*(million|thousand|k|m|billion)',  # Large numbers
+    r'\d+\s*(users|customers|clients|projects|people|employees|team members)',  # Count of things
+    r'\d+\s*(years?|months?|weeks?|days?)',  # Time periods
+    r'(increased|decreased|improved|reduced|generated|saved|exceeded).*\d+',  # Improvement metrics
+    r'\d+\s*(hours?|minutes?)',  # Time savings
+    r'\d+x\s*(faster|better|more)',  # Multiplier improvements
+    r'(over|under|within)\s*\d+',  # Comparative metrics
+    r'\d+\s*(awards?|certifications?|patents?)',  # Achievements count
+]
+
+_QUANT_RE = re.compile('|'.join(f'(?:{p})' for p in _QUANT_PATTERNS), re.IGNORECASE)
+
+# Every quantification pattern requires a digit somewhere, so a trivial
+# digit scan rejects unquantified bullets before the big alternation runs
+_DIGIT_RE = re.compile(r'\d')
+
+@lru_cache(maxsize=4096)
 def has_quantification(text):
     """Enhanced check for quantifiable metrics"""
-    patterns = [
-        r'\d+%',  # Percentages
-        r'\$[\d,]+',  # Dollar amounts with commas
-        r'\d+\s*(million|thousand|k|m|billion)',  # Large numbers
-        r'\d+\s*(users|customers|clients|projects|people|employees|team members)',  # Count of things
-        r'\d+\s*(years?|months?|weeks?|days?)',  # Time periods
-        r'(increased|decreased|improved|reduced|generated|saved|exceeded).*\d+',  # Improvement metrics
-        r'\d+\s*(hours?|minutes?)',  # Time savings
-        r'\d+x\s*(faster|better|more)',  # Multiplier improvements
-        r'(over|under|within)\s*\d+',  # Comparative metrics
-        r'\d+\s*(awards?|certifications?|patents?)',  # Achievements count
-    ]
-    
-    return any(re.search(pattern, text.lower()) for pattern in patterns)
+    return _DIGIT_RE.search(text) is not None and _QUANT_RE.search(text) is not None
 
+@lru_cache(maxsize=4096)
 def check_action_verb(text):
     """Check if text starts with a strong action verb"""
     words = text.lower().split()
     if not words:
         return {'has_verb': False, 'is_strong': False, 'verb': None}
-    
+
     first_word = words[0]
-    
-    # Check for weak phrases
-    first_two = ' '.join(words[:2]) if len(words) > 1 else ''
-    first_three = ' '.join(words[:3]) if len(words) > 2 else ''
-    
-    if first_two in WEAK_ACTION_VERBS or first_three in WEAK_ACTION_VERBS:
-        return {'has_verb': True, 'is_strong': False, 'verb': first_two or first_three}
-    
-    # Check if starts with strong verb
-    if first_word in STRONG_ACTION_VERBS:
+
+    # Fast path: most bullets that pass start with a strong single verb
+    bucket = _VERBS_BY_CHAR.get(first_word[0])
+    if bucket is not None and first_word in bucket:
         return {'has_verb': True, 'is_strong': True, 'verb': first_word}
-    
+
+    # Check for weak verbs and phrases, joining only the n-grams that can match
+    if first_word in _WEAK_SINGLE:
+        return {'has_verb': True, 'is_strong': False, 'verb': first_word}
+
+    if len(words) > 1:
+        first_two = ' '.join(words[:2])
+        if first_two in _WEAK_TWO:
+            return {'has_verb': True, 'is_strong': False, 'verb': first_two}
+
+    if len(words) > 2:
+        first_three = ' '.join(words[:3])
+        if first_three in _WEAK_THREE:
+            return {'has_verb': True, 'is_strong': False, 'verb': first_three}
+
     return {'has_verb': False, 'is_strong': False, 'verb': first_word}
 
+# Section header/indicator patterns; all sections are folded into one
+# named-group alternation at import so detect_sections makes a single
+# pass over the text and reads off which section each match belongs to
+_SECTION_PATTERNS = {
+    'experience': [r'\bexperience\b', r'\bwork history\b', r'\bemployment\b', r'\bwork experience\b', r'\bprofessional experience\b'],
+    'education': [r'\beducation\b', r'\bacademic\b', r'\bdegree\b'],
+    'skills': [r'\bskills\b', r'\bcompetencies\b', r'\btechnical skills\b', r'\bcore competencies\b', r'\bprofessional skills\b'],
+    'contact': [r'\bcontact\b', r'\bemail\b', r'\bphone\b', r'\baddress\b', r'\bmobile\b', r'\btel\b', r'@\w+\.\w+', r'\(\d{3}\)', r'\d{3}-\d{3}-\d{4}', r'\+\d+'],
+    'summary': [r'\bsummary\b', r'\bobjective\b', r'\bprofile\b'],
+    'projects': [r'\bprojects\b', r'\bportfolio\b'],
+    'certifications': [r'\bcertifications\b', r'\bcertificates\b']
+}
+
+_ALL_SECTIONS_RE = re.compile(
+    '|'.join(
+        f"(?P<{section}>" + '|'.join(f'(?:{p})' for p in patterns) + ')'
+        for section, patterns in _SECTION_PATTERNS.items()
+    ),
+    re.IGNORECASE,
+)
+
 def detect_sections(text):
     """Detect which resume sections are present"""
-    text_lower = text.lower()
-    
-    sections_found = []
-    sections_missing = []
-    
-    section_patterns = {
-        'experience': [r'\bexperience\b', r'\bwork history\b', r'\bemployment\b', r'\bwork experience\b', r'\bprofessional experience\b'],
-        'education': [r'\beducation\b', r'\bacademic\b', r'\bdegree\b'],
-        'skills': [r'\bskills\b', r'\bcompetencies\b', r'\btechnical skills\b', r'\bcore competencies\b', r'\bprofessional skills\b'],
-        'contact': [r'\bcontact\b', r'\bemail\b', r'\bphone\b', r'\baddress\b', r'\bmobile\b', r'\btel\b', r'@\w+\.\w+', r'\(\d{3}\)', r'\d{3}-\d{3}-\d{4}', r'\+\d+'],
-        'summary': [r'\bsummary\b', r'\bobjective\b', r'\bprofile\b'],
-        'projects': [r'\bprojects\b', r'\bportfolio\b'],
-        'certifications': [r'\bcertifications\b', r'\bcertificates\b']
-    }
-    
-    for section, patterns in section_patterns.items():
-        found = any(re.search(pattern, text_lower) for pattern in patterns)
-        if found:
-            sections_found.append(section)
-        elif section in REQUIRED_SECTIONS:
-            sections_missing.append(section)
-    
+    seen = set()
+    for match in _ALL_SECTIONS_RE.finditer(text):
+        seen.add(match.lastgroup)
+        if len(seen) == len(_SECTION_PATTERNS):
+            break
+
+    sections_found = [section for section in _SECTION_PATTERNS if section in seen]
+    sections_missing = [section for section in REQUIRED_SECTIONS if section not in seen]
+
     # Check if all critical sections are present
     critical_sections_missing = [section for section in CRITICAL_SECTIONS if section not in sections_found]
     has_all_critical_sections = len(critical_sections_missing) == 0
@@ -120,15 +181,47 @@ def detect_sections(text):
         'has_all_critical': has_all_critical_sections
     }
 
+# Separator used when joining bullets for the combined scan; the NUL byte is
+# not whitespace, so no quantification pattern can match across two bullets
+_SCAN_SEP = '\n\x00'
+
+def _scan_bullets(bullets):
+    """Run the quantification and typo scans once over all bullets joined.
+
+    Returns (quant_hits, typo_hits): the set of bullet indexes with a
+    quantification match, and a dict of bullet index -> set of typos found.
+    Match offsets are mapped back to bullet indexes with a bisect over the
+    precomputed start offset of each bullet.
+    """
+    joined = _SCAN_SEP.join(bullets)
+    starts = [0]
+    for bullet in bullets[:-1]:
+        starts.append(starts[-1] + len(bullet) + len(_SCAN_SEP))
+
+    quant_hits = set()
+    if _DIGIT_RE.search(joined):
+        for match in _QUANT_RE.finditer(joined):
+            quant_hits.add(bisect_right(starts, match.start()) - 1)
+
+    typo_hits = {}
+    for match in _TYPO_RE.finditer(joined):
+        typo_hits.setdefault(bisect_right(starts, match.start()) - 1, set()).add(match.group().lower())
+
+    return quant_hits, typo_hits
+
 def analyze_bullets(bullets):
     """Analyze bullet points for NLP issues"""
-    analysis = []
-    
-    for bullet in bullets:
+    # Bullets repeated verbatim across roles are analyzed once; the
+    # shared result is broadcast back to every position at the end
+    unique = list(dict.fromkeys(bullets))
+    by_text = {}
+    quant_hits, typo_hits = _scan_bullets(unique) if unique else (set(), {})
+
+    for index, bullet in enumerate(unique):
         bullet_analysis = {
             'text': bullet,
             'issues': [],
-            'has_quantification': has_quantification(bullet),
+            'has_quantification': index in quant_hits,
             'action_verb': check_action_verb(bullet)
         }
         
@@ -170,31 +263,20 @@ def analyze_bullets(bullets):
             })
         
         # Basic grammar/spelling checks (with very low severity weight)
-        bullet_lower = bullet.lower()
-        
         # Check for common grammar issues (minimal penalty)
         grammar_issues = []
-        
+
         # Double spaces
         if '  ' in bullet:
             grammar_issues.append('Remove extra spaces')
-        
+
         # Missing periods at end (if bullet is long enough)
-        if word_count > 8 and not bullet.rstrip().endswith('.'):
+        if word_count > 8 and not bullet.rstrip().endswith(_SENTENCE_END):
             grammar_issues.append('Consider adding period at end of sentence')
-        
-        # Common typos (very basic check)
-        common_typos = {
-            'recieve': 'receive',
-            'seperate': 'separate', 
-            'occured': 'occurred',
-            'managment': 'management',
-            'sucessful': 'successful'
-        }
-        
-        for typo, correction in common_typos.items():
-            if typo in bullet_lower:
-                grammar_issues.append(f'Possible typo: "{typo}" should be "{correction}"')
+
+        # Typos found by the combined scan above
+        for typo in sorted(typo_hits.get(index, ())):
+            grammar_issues.append(f'Possible typo: "{typo}" should be "{COMMON_TYPOS[typo]}"')
         
         # Add grammar issues with very low severity (minimal impact on score)
         for issue in grammar_issues:
@@ -204,10 +286,11 @@ def analyze_bullets(bullets):
                 'severity': 'low'  # Low severity = minimal score impact
             })
         
-        analysis.append(bullet_analysis)
-    
-    return analysis
+        by_text[bullet] = bullet_analysis
 
+    return [by_text[bullet] for bullet in bullets]
+
+@lru_cache(maxsize=256)
 def analyze_text(text):
     """Main NLP analysis function"""
     bullets = extract_bullet_points(text)
@@ -236,12 +319,12 @@ def main():
     import sys
     
     if len(sys.argv) < 2:
-        print(json.dumps({"success": False, "error": "No text provided"}))
+        sys.stdout.buffer.write(_dumps({"success": False, "error": "No text provided"}) + b'\n')
         sys.exit(1)
-    
+
     text = sys.argv[1]
     result = analyze_text(text)
-    print(json.dumps(result))
+    sys.stdout.buffer.write(_dumps(result) + b'\n')
 
 if __name__ == "__main__":
     main()
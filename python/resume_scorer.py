@@ -5,7 +5,24 @@ Resume Scorer - Score resume on multiple criteria
 import sys
 import json
 import re
+import os
+import hashlib
+import tempfile
+from bisect import bisect_right
 from collections import Counter
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
 from resume_parser import parse_pdf, parse_docx
 from nlp_analyzer import analyze_text
 from keyword_extractor import extract_keywords
@@ -14,22 +31,109 @@ from enhanced_analyzer import EnhancedResumeAnalyzer
 
 # Industry-specific keywords for better scoring
 INDUSTRY_KEYWORDS = {
-    'technology': ['python', 'javascript', 'react', 'node.js', 'aws', 'docker', 'kubernetes', 'api', 'database', 'sql', 'git', 'agile', 'scrum'],
-    'data_science': ['machine learning', 'data analysis', 'python', 'r', 'sql', 'tableau', 'statistics', 'modeling', 'pandas', 'numpy'],
-    'business': ['strategy', 'analysis', 'management', 'leadership', 'project management', 'stakeholder', 'roi', 'kpi'],
-    'marketing': ['digital marketing', 'seo', 'social media', 'analytics', 'campaign', 'brand', 'conversion', 'engagement'],
-    'finance': ['financial analysis', 'budgeting', 'forecasting', 'excel', 'financial modeling', 'accounting', 'audit']
+    'technology': ('python', 'javascript', 'react', 'node.js', 'aws', 'docker', 'kubernetes', 'api', 'database', 'sql', 'git', 'agile', 'scrum'),
+    'data_science': ('machine learning', 'data analysis', 'python', 'r', 'sql', 'tableau', 'statistics', 'modeling', 'pandas', 'numpy'),
+    'business': ('strategy', 'analysis', 'management', 'leadership', 'project management', 'stakeholder', 'roi', 'kpi'),
+    'marketing': ('digital marketing', 'seo', 'social media', 'analytics', 'campaign', 'brand', 'conversion', 'engagement'),
+    'finance': ('financial analysis', 'budgeting', 'forecasting', 'excel', 'financial modeling', 'accounting', 'audit')
 }
 
+# All industry keywords folded into one lookahead alternation compiled at
+# import. The lookahead makes matches overlap-safe (a keyword contained in
+# a longer one, like 'modeling' inside 'financial modeling', still fires)
+# and longer alternatives are listed first so they win at a shared start.
+_INDUSTRY_KW_RE = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(kw)
+        for kw in sorted({kw for kws in INDUSTRY_KEYWORDS.values() for kw in kws},
+                         key=len, reverse=True)
+    ) + '))'
+)
+
+# Specific achievement patterns folded into one alternation; each branch
+# is named so a single finditer pass can count how many distinct pattern
+# kinds appear (same 0-5 range the old per-pattern searches produced).
+# The lookahead keeps branches overlap-safe, e.g. the dollar amount
+# inside 'saved $50,000' still counts on its own.
+_ACHIEVEMENT_ALT = re.compile(
+    r'(?=(?P<pct_change>\d+%\s*(?:increase|improvement|growth|reduction|decrease))'
+    r'|(?P<dollars>\$[\d,]+)'
+    r'|(?P<counts>\d+\s*(?:users|customers|clients|projects|people|team members))'
+    r'|(?P<verb_metric>(?:saved|generated|increased|reduced)\s*(?:\$?[\d,]+|[\d.]+%))'
+    r'|(?P<led_team>(?:led|managed)\s*(?:team of|group of)?\s*\d+))'
+)
+
 # Achievement impact words for better scoring
 IMPACT_WORDS = {
-    'high_impact': ['increased', 'decreased', 'improved', 'optimized', 'reduced', 'generated', 'saved', 'exceeded', 'achieved', 'delivered'],
-    'medium_impact': ['developed', 'created', 'implemented', 'designed', 'built', 'established', 'launched', 'managed'],
-    'quantifiers': ['%', 'percent', '$', 'million', 'thousand', 'users', 'customers', 'team', 'projects', 'revenue']
+    'high_impact': ('increased', 'decreased', 'improved', 'optimized', 'reduced', 'generated', 'saved', 'exceeded', 'achieved', 'delivered'),
+    'medium_impact': ('developed', 'created', 'implemented', 'designed', 'built', 'established', 'launched', 'managed'),
+    'quantifiers': ('%', 'percent', '$', 'million', 'thousand', 'users', 'customers', 'team', 'projects', 'revenue')
 }
 
+# Structure score by bullet count: 0 bullets -> 0, 1-7 -> 10, 8-20 -> 15
+# (the sweet spot), 21+ -> 10; indexed via bisect over the boundaries
+_BULLET_BOUNDS = (1, 8, 21)
+_BULLET_TIER_SCORES = (0, 10, 15, 10)
+
+# Shared analyzer instance: construction loads word lists and compiled
+# tables, so one instance serves every resume scored by this process
+_ENHANCED_ANALYZER = None
+
+def _get_analyzer():
+    """Return the shared EnhancedResumeAnalyzer, constructing it on first use"""
+    global _ENHANCED_ANALYZER
+    if _ENHANCED_ANALYZER is None:
+        _ENHANCED_ANALYZER = EnhancedResumeAnalyzer()
+    return _ENHANCED_ANALYZER
+
+# Word-to-category map and lookahead alternation so all three impact
+# word lists are counted in one pass over the text
+_IMPACT_CATEGORY = {word: category for category, words in IMPACT_WORDS.items() for word in words}
+_IMPACT_RE = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(word) for word in sorted(_IMPACT_CATEGORY, key=len, reverse=True)
+    ) + '))'
+)
+
+# Version salt for the on-disk analysis cache; bump when any of the
+# cached analyses change shape or logic
+_CACHE_VERSION = '1'
+
+def _analysis_cache_path(text):
+    """Cache file path for a resume text, keyed by content digest"""
+    digest = hashlib.blake2b((_CACHE_VERSION + '\x00' + text).encode(), digest_size=16).hexdigest()
+    return os.path.join(tempfile.gettempdir(), 'resume_scorer_cache', digest + '.json')
+
+def _analyze_cached(text):
+    """Run the NLP, keyword, and enhanced analyses for a text, reusing the
+    disk-cached result when the same resume was scored before"""
+    cache_path = _analysis_cache_path(text)
+    try:
+        with open(cache_path) as cache_file:
+            cached = json.load(cache_file)
+        return cached['nlp'], cached['keywords'], cached['enhanced']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    nlp_analysis = analyze_text(text)
+    keywords = extract_keywords(text)
+    enhanced_analysis = _get_analyzer().analyze_resume(text)
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as cache_file:
+            json.dump({'nlp': nlp_analysis, 'keywords': keywords, 'enhanced': enhanced_analysis}, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # caching is best-effort; scoring still succeeds without it
+
+    return nlp_analysis, keywords, enhanced_analysis
+
 def calculate_score(nlp_analysis, keywords, raw_text=""):
     """Calculate overall resume score with enhanced analysis"""
+    # Lowercase the text once here; both helpers below scan it case-folded
+    text_lower = raw_text.lower()
     scores = {
         'ats_compatibility': 0,      # 0-25 points
         'content_quality': 0,        # 0-30 points (reduced from 35)
@@ -58,20 +162,19 @@ def calculate_score(nlp_analysis, keywords, raw_text=""):
         }
     
     # ATS Compatibility (0-25 points) - Unchanged
-    sections_found = sections['found']
-    sections_missing = sections['missing']
-    section_score = (len(sections_found) / (len(sections_found) + len(sections_missing))) * 25 if (len(sections_found) + len(sections_missing)) > 0 else 0
+    found_count = len(sections['found'])
+    missing_count = len(sections['missing'])
+    total_sections = found_count + missing_count
+    section_score = (found_count / total_sections) * 25 if total_sections else 0
     scores['ats_compatibility'] = round(section_score)
-    
+
     # Content Quality (0-30 points) - Enhanced analysis
     stats = nlp_analysis['statistics']
-    
-    # Metrics usage (0-15 points)
-    metrics_score = (stats['metrics_percentage'] / 100) * 15
-    
-    # Action verbs (0-15 points)
-    verbs_score = (stats['strong_verbs_percentage'] / 100) * 15
-    
+
+    # Metrics usage (0-15 points) and action verbs (0-15 points)
+    metrics_score = stats['metrics_percentage'] * 0.15
+    verbs_score = stats['strong_verbs_percentage'] * 0.15
+
     scores['content_quality'] = round(metrics_score + verbs_score)
     
     # Add feedback for content quality
@@ -90,37 +193,27 @@ def calculate_score(nlp_analysis, keywords, raw_text=""):
     base_keyword_score = min(15, keyword_count * 1.5)
     
     # Industry relevance bonus (0-5 points)
-    industry_bonus = calculate_industry_relevance(keywords.get('technical_skills', []), raw_text)
+    industry_bonus = calculate_industry_relevance(keywords.get('technical_skills', []), text_lower)
     detailed_feedback['industry_analysis'] = industry_bonus['analysis']
     
     scores['keyword_optimization'] = round(base_keyword_score + industry_bonus['score'])
     
     # Structure (0-15 points) - Unchanged
     bullet_count = stats['total_bullets']
-    if bullet_count >= 8 and bullet_count <= 20:
-        structure_score = 15
-    elif bullet_count > 0:
-        structure_score = 10
-    else:
-        structure_score = 0
-    scores['structure'] = structure_score
+    scores['structure'] = _BULLET_TIER_SCORES[bisect_right(_BULLET_BOUNDS, bullet_count)]
     
     # Achievement Impact (0-10 points) - NEW
-    impact_analysis = calculate_achievement_impact(nlp_analysis.get('bullet_points', []), raw_text)
+    impact_analysis = calculate_achievement_impact(nlp_analysis.get('bullet_points', []), text_lower)
     scores['achievement_impact'] = impact_analysis['score']
     detailed_feedback['specific_suggestions'].extend(impact_analysis['suggestions'])
     
     # Language Quality (0-5 points) - Low weight for grammar/spelling
     # This gives minimal penalty for grammatical errors
     language_score = 5  # Start with full points
-    
+
     # Count issues with low severity (grammar-related)
-    total_language_issues = 0
-    for bullet in nlp_analysis['bullet_points']:
-        for issue in bullet['issues']:
-            if issue['severity'] == 'low':  # Grammar/spelling issues are typically low severity
-                total_language_issues += 1
-    
+    total_language_issues = _collect_bullet_feedback(nlp_analysis['bullet_points'])[1]
+
     # Reduce score minimally for language issues (max 2 points deduction)
     if total_language_issues > 0:
         language_penalty = min(2, total_language_issues * 0.2)  # Very small penalty
@@ -141,45 +234,50 @@ def calculate_score(nlp_analysis, keywords, raw_text=""):
         'performance_tier': performance_tier
     }
 
-def generate_feedback(nlp_analysis):
-    """Generate line-by-line feedback"""
+def _collect_bullet_feedback(bullet_points):
+    """One pass over the analyzed bullets: line-level feedback entries
+    plus the count of low-severity (grammar/spelling) issues"""
     feedback = []
-    
-    for bullet in nlp_analysis['bullet_points']:
-        if bullet['issues']:
+    language_issues = 0
+
+    for bullet in bullet_points:
+        issues = bullet['issues']
+        if issues:
+            text = bullet['text']
             feedback.append({
-                'text': bullet['text'][:100] + '...' if len(bullet['text']) > 100 else bullet['text'],
-                'issues': bullet['issues']
+                'text': text[:100] + '...' if len(text) > 100 else text,
+                'issues': issues
             })
-    
-    return feedback
+            language_issues += sum(1 for issue in issues if issue['severity'] == 'low')
+
+    return feedback, language_issues
+
+def generate_feedback(nlp_analysis):
+    """Generate line-by-line feedback"""
+    return _collect_bullet_feedback(nlp_analysis['bullet_points'])[0]
 
-def calculate_industry_relevance(technical_skills, raw_text):
+def calculate_industry_relevance(technical_skills, text_lower):
     """Calculate industry relevance bonus and provide analysis"""
-    text_lower = raw_text.lower()
-    skills_lower = [skill.lower() for skill in technical_skills]
-    
+    # One scan over the text and the joined skills finds every keyword;
+    # the per-industry loop then just filters against the found set
+    haystack = text_lower + '\n' + '\n'.join(skill.lower() for skill in technical_skills)
+    found = {match.group(1) for match in _INDUSTRY_KW_RE.finditer(haystack)}
+
     industry_scores = {}
     best_industry = None
     best_score = 0
-    
+
     for industry, keywords in INDUSTRY_KEYWORDS.items():
-        matches = 0
-        matched_keywords = []
-        
-        for keyword in keywords:
-            # Check in both skills and raw text
-            if any(keyword in skill for skill in skills_lower) or keyword in text_lower:
-                matches += 1
-                matched_keywords.append(keyword)
-        
+        matched_keywords = [keyword for keyword in keywords if keyword in found]
+        matches = len(matched_keywords)
+
         score = min(5, matches * 0.8)  # Up to 5 points
         industry_scores[industry] = {
             'score': score,
             'matches': matches,
             'keywords': matched_keywords
         }
-        
+
         if score > best_score:
             best_score = score
             best_industry = industry
@@ -202,32 +300,29 @@ def calculate_industry_relevance(technical_skills, raw_text):
         'analysis': analysis
     }
 
-def calculate_achievement_impact(bullet_points, raw_text):
+def calculate_achievement_impact(bullet_points, text_lower):
     """Calculate achievement impact score and provide suggestions"""
     impact_score = 0
     suggestions = []
-    text_lower = raw_text.lower()
-    
-    # Count high-impact words
-    high_impact_count = sum(1 for word in IMPACT_WORDS['high_impact'] if word in text_lower)
-    medium_impact_count = sum(1 for word in IMPACT_WORDS['medium_impact'] if word in text_lower)
-    quantifier_count = sum(1 for word in IMPACT_WORDS['quantifiers'] if word in text_lower)
+
+    # Count the distinct impact words of each category in one traversal
+    found = {'high_impact': set(), 'medium_impact': set(), 'quantifiers': set()}
+    for match in _IMPACT_RE.finditer(text_lower):
+        word = match.group(1)
+        found[_IMPACT_CATEGORY[word]].add(word)
+
+    high_impact_count = len(found['high_impact'])
+    medium_impact_count = len(found['medium_impact'])
+    quantifier_count = len(found['quantifiers'])
     
     # Score based on impact language
     impact_score += min(4, high_impact_count * 0.8)  # Up to 4 points
     impact_score += min(3, medium_impact_count * 0.5)  # Up to 3 points
     impact_score += min(3, quantifier_count * 0.4)    # Up to 3 points
     
-    # Check for specific achievement patterns
-    achievement_patterns = [
-        r'\d+%\s*(increase|improvement|growth|reduction|decrease)',
-        r'\$[\d,]+',  # Dollar amounts
-        r'\d+\s*(users|customers|clients|projects|people|team members)',
-        r'(saved|generated|increased|reduced)\s*(\$?[\d,]+|[\d.]+%)',
-        r'(led|managed)\s*(team of|group of)?\s*\d+'
-    ]
-    
-    pattern_matches = sum(1 for pattern in achievement_patterns if re.search(pattern, text_lower))
+    # Check for specific achievement patterns; one pass, counting the
+    # distinct branches that fired
+    pattern_matches = len({match.lastgroup for match in _ACHIEVEMENT_ALT.finditer(text_lower)})
     if pattern_matches > 0:
         impact_score += min(2, pattern_matches * 0.5)  # Bonus for specific patterns
     
@@ -254,140 +349,176 @@ def calculate_achievement_impact(bullet_points, raw_text):
         }
     }
 
+# Performance tiers in ascending score order with their lower bounds;
+# bisect over the bounds picks the tier without rebuilding the dicts
+_TIER_BOUNDS = (40, 55, 70, 85)
+_TIERS = (
+    {
+        'tier': 'Needs Work',
+        'description': 'Major revisions required',
+        'color': '#ef4444',
+        'advice': 'Start with the critical requirements, then build up content quality.'
+    },
+    {
+        'tier': 'Developing',
+        'description': 'Needs significant improvements',
+        'color': '#f59e0b',
+        'advice': 'Focus on adding quantifiable achievements and stronger content.'
+    },
+    {
+        'tier': 'Good',
+        'description': 'Solid foundation with room for improvement',
+        'color': '#eab308',
+        'advice': 'Good start! Address the key areas for significant improvement.'
+    },
+    {
+        'tier': 'Strong',
+        'description': 'Competitive and well-structured',
+        'color': '#22c55e',
+        'advice': 'Great resume! Focus on the specific improvements suggested.'
+    },
+    {
+        'tier': 'Exceptional',
+        'description': 'Industry-leading resume quality',
+        'color': '#10b981',
+        'advice': 'Your resume is outstanding! Minor tweaks could make it perfect.'
+    }
+)
+
 def get_performance_tier(total_score):
     """Categorize resume performance into tiers"""
-    if total_score >= 85:
-        return {
-            'tier': 'Exceptional',
-            'description': 'Industry-leading resume quality',
-            'color': '#10b981',
-            'advice': 'Your resume is outstanding! Minor tweaks could make it perfect.'
-        }
-    elif total_score >= 70:
-        return {
-            'tier': 'Strong',
-            'description': 'Competitive and well-structured',
-            'color': '#22c55e',
-            'advice': 'Great resume! Focus on the specific improvements suggested.'
-        }
-    elif total_score >= 55:
-        return {
-            'tier': 'Good',
-            'description': 'Solid foundation with room for improvement',
-            'color': '#eab308',
-            'advice': 'Good start! Address the key areas for significant improvement.'
-        }
-    elif total_score >= 40:
-        return {
-            'tier': 'Developing',
-            'description': 'Needs significant improvements',
-            'color': '#f59e0b',
-            'advice': 'Focus on adding quantifiable achievements and stronger content.'
-        }
+    return _TIERS[bisect_right(_TIER_BOUNDS, total_score)]
+
+def _print_json(obj):
+    """Serialize and emit one JSON object on stdout"""
+    sys.stdout.buffer.write(_dumps(obj) + b'\n')
+
+def _score_file(file_path, slim=False):
+    """Parse, analyze, and score one resume file; returns the response dict"""
+    # Parse resume
+    if file_path.endswith('.pdf'):
+        parsed = parse_pdf(file_path)
+    elif file_path.endswith('.docx'):
+        parsed = parse_docx(file_path)
     else:
+        return {"success": False, "error": "Unsupported file type"}
+
+    if not parsed['success']:
+        return parsed
+
+    text = parsed['text']
+
+    # NLP, keyword, and enhanced analyses (disk-cached by text digest)
+    nlp_analysis, keywords, enhanced_analysis = _analyze_cached(text)
+    enhanced_analyzer = _get_analyzer()
+
+    # CRITICAL CHECK: ensure resume has either Experience or Projects HEADERS before scoring
+    # Use strict header detection (not content-based inference) to ensure proper section structure
+    explicit_headers = enhanced_analyzer.detect_explicit_headers_only(text)  # Get only explicit section headers
+    has_experience_header = 'experience' in explicit_headers  # True if explicit Experience header found
+    has_projects_header = 'projects' in explicit_headers      # True if explicit Projects header found
+
+    if not has_experience_header and not has_projects_header:
+        # If neither Experience nor Projects exists, we cannot meaningfully score the resume
         return {
-            'tier': 'Needs Work',
-            'description': 'Major revisions required',
-            'color': '#ef4444',
-            'advice': 'Start with the critical requirements, then build up content quality.'
+            "success": False,
+            "error": "We could not find an Experience or Projects section, which is required to score your resume.",
+            "code": "missing_experience_projects"
+        }
+
+    # Use the enhanced analyzer's final score as the single source of truth
+    # final_score_data contains: category_scores (per-criterion), weights, final_score (0-100), grade
+    final_score_data = enhanced_analysis.get('final_score', {})
+    enhanced_total_score = final_score_data.get('final_score', 0)  # Overall 0-100 score from enhanced analysis
+    enhanced_breakdown = final_score_data.get('category_scores', {})  # Per-criterion scores used for breakdown
+
+    # Derive performance tier from the enhanced total score so tiers stay consistent with the visible score
+    performance_tier = get_performance_tier(enhanced_total_score)
+
+    # Generate line-by-line feedback from the NLP analysis (still useful for user guidance)
+    feedback = generate_feedback(nlp_analysis)
+
+    # Generate comprehensive recommendations using the new system
+    sections_found = nlp_analysis.get('sections_found', {})
+    sections_data = {
+        'experience': {'found': sections_found.get('experience', False)},
+        'education': {'found': sections_found.get('education', False)},
+        'skills': {'found': sections_found.get('skills', False)},
+        'contact': {'found': sections_found.get('contact', False)}
+    }
+
+    recommendations = generate_comprehensive_recommendations(
+        resume_data={'text': parsed['text']},  # Raw resume text for recommendation engine
+        statistics=nlp_analysis['statistics'],  # High-level statistics from NLP analyzer
+        sections=sections_data  # Section presence data for completeness checks
+    )
+
+    # Build the final result object returned to Node
+    # "score" and "breakdown" now come exclusively from the enhanced analyzer's 12-criteria scoring
+    result = {
+        'success': True,
+        'score': enhanced_total_score,  # Unified 0-100 score based on individual criteria weights
+        'breakdown': enhanced_breakdown,  # Per-criterion scores for frontend breakdown display
+        'performance_tier': performance_tier,  # Tier derived from the enhanced total score
+        'detailed_feedback': {},  # Legacy detailed feedback from calculate_score is no longer used
+        'feedback': feedback,  # Line-level feedback from NLP analysis
+        'recommendations': recommendations,  # Comprehensive recommendation set
+        'statistics': nlp_analysis['statistics'],  # NLP statistics for debugging/extra UI
+        'resume_content': parsed['text'],  # Include raw text for frontend display
+        'enhanced_analysis': enhanced_analysis  # Full enhanced analysis object (criteria + final_score)
+    }
+
+    if slim:
+        del result['resume_content']
+        result['enhanced_analysis'] = {
+            'final_score': final_score_data,
+            'criteria': enhanced_analysis.get('criteria', [])
         }
 
+    return result
+
+def _serve(slim=False):
+    """Worker mode: one JSON request per stdin line ({"path": ...}), one
+    response per stdout line, so interpreter startup and analyzer
+    construction amortize over many resumes instead of being paid per
+    invocation"""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = _loads(line)
+            result = _score_file(request['path'], slim=request.get('slim', slim))
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        _print_json(result)
+        sys.stdout.buffer.flush()
+
 def main():
-    if len(sys.argv) < 2:
-        print(json.dumps({"success": False, "error": "No file path provided"}))
+    args = sys.argv[1:]
+    # --slim drops resume_content and trims enhanced_analysis down to the
+    # score data, roughly halving the JSON pushed through the pipe for
+    # callers that don't render the full analysis
+    slim = '--slim' in args
+
+    if '--serve' in args:
+        _serve(slim)
+        return
+
+    paths = [arg for arg in args if not arg.startswith('--')]
+    if not paths:
+        _print_json({"success": False, "error": "No file path provided"})
         sys.exit(1)
-    
-    file_path = sys.argv[1]
-    
+
     try:
-        # Parse resume
-        if file_path.endswith('.pdf'):
-            parsed = parse_pdf(file_path)
-        elif file_path.endswith('.docx'):
-            parsed = parse_docx(file_path)
-        else:
-            print(json.dumps({"success": False, "error": "Unsupported file type"}))
-            sys.exit(1)
-        
-        if not parsed['success']:
-            print(json.dumps(parsed))
-            sys.exit(1)
-        
-        text = parsed['text']
-        
-        # Analyze with NLP
-        nlp_analysis = analyze_text(text)
-        
-        # Extract keywords
-        keywords = extract_keywords(text)
-        
-        # Enhanced comprehensive analysis using the new analyzer
-        enhanced_analyzer = EnhancedResumeAnalyzer()  # Create enhanced analyzer instance
-        enhanced_analysis = enhanced_analyzer.analyze_resume(text)  # Run full enhanced analysis on the resume text
-
-        # CRITICAL CHECK: ensure resume has either Experience or Projects HEADERS before scoring
-        # Use strict header detection (not content-based inference) to ensure proper section structure
-        explicit_headers = enhanced_analyzer.detect_explicit_headers_only(text)  # Get only explicit section headers
-        has_experience_header = 'experience' in explicit_headers  # True if explicit Experience header found
-        has_projects_header = 'projects' in explicit_headers      # True if explicit Projects header found
-
-        if not has_experience_header and not has_projects_header:
-            # If neither Experience nor Projects exists, we cannot meaningfully score the resume
-            error_result = {
-                "success": False,
-                "error": "We could not find an Experience or Projects section, which is required to score your resume.",
-                "code": "missing_experience_projects"
-            }
-            print(json.dumps(error_result))  # Send structured error back to Node for redirect/error page handling
-            sys.exit(0)  # Exit cleanly so Node can consume the JSON instead of treating it as a crash
-
-        # Use the enhanced analyzer's final score as the single source of truth
-        # final_score_data contains: category_scores (per-criterion), weights, final_score (0-100), grade
-        final_score_data = enhanced_analysis.get('final_score', {})
-        enhanced_total_score = final_score_data.get('final_score', 0)  # Overall 0-100 score from enhanced analysis
-        enhanced_breakdown = final_score_data.get('category_scores', {})  # Per-criterion scores used for breakdown
-        
-        # Derive performance tier from the enhanced total score so tiers stay consistent with the visible score
-        performance_tier = get_performance_tier(enhanced_total_score)
-        
-        # Generate line-by-line feedback from the NLP analysis (still useful for user guidance)
-        feedback = generate_feedback(nlp_analysis)
-        
-        # Generate comprehensive recommendations using the new system
-        sections_found = nlp_analysis.get('sections_found', {})
-        sections_data = {
-            'experience': {'found': sections_found.get('experience', False)},
-            'education': {'found': sections_found.get('education', False)},
-            'skills': {'found': sections_found.get('skills', False)},
-            'contact': {'found': sections_found.get('contact', False)}
-        }
-        
-        recommendations = generate_comprehensive_recommendations(
-            resume_data={'text': parsed['text']},  # Raw resume text for recommendation engine
-            statistics=nlp_analysis['statistics'],  # High-level statistics from NLP analyzer
-            sections=sections_data  # Section presence data for completeness checks
-        )
-        
-        # Build the final result object returned to Node
-        # "score" and "breakdown" now come exclusively from the enhanced analyzer's 12-criteria scoring
-        result = {
-            'success': True,
-            'score': enhanced_total_score,  # Unified 0-100 score based on individual criteria weights
-            'breakdown': enhanced_breakdown,  # Per-criterion scores for frontend breakdown display
-            'performance_tier': performance_tier,  # Tier derived from the enhanced total score
-            'detailed_feedback': {},  # Legacy detailed feedback from calculate_score is no longer used
-            'feedback': feedback,  # Line-level feedback from NLP analysis
-            'recommendations': recommendations,  # Comprehensive recommendation set
-            'statistics': nlp_analysis['statistics'],  # NLP statistics for debugging/extra UI
-            'resume_content': parsed['text'],  # Include raw text for frontend display
-            'enhanced_analysis': enhanced_analysis  # Full enhanced analysis object (criteria + final_score)
-        }
-        
-        print(json.dumps(result))
-        
+        result = _score_file(paths[0], slim=slim)
     except Exception as e:
-        print(json.dumps({"success": False, "error": str(e)}))
+        _print_json({"success": False, "error": str(e)})
         sys.exit(0)  # Exit cleanly so Node can read the JSON error instead of treating it as a crash
 
+    _print_json(result)
+    if not result.get('success') and result.get('code') != 'missing_experience_projects':
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
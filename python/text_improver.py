@@ -5,8 +5,9 @@ Text Improver - Suggest improvements for resume text
 import sys
 import json
 import re
-from resume_parser import parse_pdf, parse_docx
-from nlp_analyzer import analyze_text, STRONG_ACTION_VERBS
+import os
+import hashlib
+import tempfile
 
 # Verb replacement suggestions
 VERB_IMPROVEMENTS = {
@@ -19,76 +20,180 @@ VERB_IMPROVEMENTS = {
     'responsible': ['led', 'managed', 'directed', 'oversaw']
 }
 
+# Fallback replacements for verbs without a curated entry, materialized
+# on first miss (the import is deferred with the other heavy modules)
+_FALLBACK_STRONG_VERBS = None
+
+def _fallback_verbs():
+    """Return the shared strong-verb fallback tuple, building it on first use"""
+    global _FALLBACK_STRONG_VERBS
+    if _FALLBACK_STRONG_VERBS is None:
+        from nlp_analyzer import STRONG_ACTION_VERBS
+        _FALLBACK_STRONG_VERBS = tuple(list(STRONG_ACTION_VERBS)[:3])
+    return _FALLBACK_STRONG_VERBS
+
+class VerbSuggestionTrie:
+    """Prefix trie mapping verb stems to replacement suggestions, so
+    conjugations like 'managing' or 'creates' hit the same entry as the
+    curated past-tense forms without listing each inflection"""
+
+    def __init__(self):
+        self._root = {}
+
+    def insert(self, stem, suggestions):
+        node = self._root
+        for char in stem:
+            node = node.setdefault(char, {})
+        node['$'] = suggestions
+
+    def longest_prefix_match(self, word):
+        """Suggestions for the longest stem prefixing word, or None"""
+        node = self._root
+        found = None
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get('$', found)
+        return found
+
+# Stems are deliberately conservative: short enough to catch the common
+# inflections, long enough not to swallow unrelated verbs ('do' would
+# also match 'documented', so the did/doing forms are spelled out)
+# First word plus remainder in one C-level match, instead of a split()
+# that tokenizes the whole bullet to read one word
+_FIRST_WORD_RE = re.compile(r'^\s*(\S+)(.*)$', re.DOTALL)
+
+_VERB_SUGGESTION_TRIE = VerbSuggestionTrie()
+for _stem, _verb in (('manag', 'managed'), ('creat', 'created'), ('help', 'helped'),
+                     ('work', 'worked'), ('mak', 'made'), ('made', 'made'),
+                     ('did', 'did'), ('doing', 'did'), ('respons', 'responsible')):
+    _VERB_SUGGESTION_TRIE.insert(_stem, VERB_IMPROVEMENTS[_verb])
+
+# Supported upload extensions and their parser names; splitext keeps the
+# dispatch case-insensitive, so .PDF uploads work too. Names rather than
+# functions, so resume_parser (and pdfplumber/python-docx behind it) is
+# only imported when a file actually needs parsing
+_PARSERS = {'.pdf': 'parse_pdf', '.docx': 'parse_docx'}
+
+# Version salt for the on-disk parse/NLP cache; bump when the parsed or
+# analyzed output shape changes
+_CACHE_VERSION = '1'
+
+def _analysis_cache_path(file_bytes):
+    """Cache file path for an upload, keyed by a digest of its bytes"""
+    digest = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f'resume_nlp_{_CACHE_VERSION}_{digest}.json')
+
+# Per-issue suggestion templates; improve_bullet shallow-copies one and
+# fills in only the fields that vary per bullet
+# Values are interned so every copied suggestion dict in a long batch
+# run points at one shared string object
+_TMPL_METRICS = {'type': sys.intern('add_metrics'),
+                 'suggestion': sys.intern('Add specific numbers or percentages')}
+_TMPL_ACTION_VERB = {'type': sys.intern('add_action_verb'),
+                     'suggestion': sys.intern('Start with a strong action verb')}
+_TMPL_WEAK_VERB = {'type': sys.intern('improve_verb')}
+
+# Constant halves of the example strings, so the handlers concatenate
+# instead of running f-string formatting per issue
+_METRICS_SUFFIX = ' [Add: by X%, reducing costs by $Y, impacting Z users]'
+_AV_PREFIX = '[Action verb]: '
+
+def _suggest_metrics(bullet_text, first_word, rest):
+    suggestion = _TMPL_METRICS.copy()
+    suggestion['example'] = bullet_text + _METRICS_SUFFIX
+    return suggestion
+
+def _suggest_action_verb(bullet_text, first_word, rest):
+    suggestion = _TMPL_ACTION_VERB.copy()
+    suggestion['example'] = _AV_PREFIX + bullet_text
+    return suggestion
+
+def _suggest_verb_replacement(bullet_text, first_word, rest):
+    replacements = (_VERB_SUGGESTION_TRIE.longest_prefix_match(first_word)
+                    or _fallback_verbs())
+    suggestion = _TMPL_WEAK_VERB.copy()
+    suggestion['suggestion'] = f'Replace with: {", ".join(replacements)}'
+    suggestion['example'] = f"{replacements[0].capitalize()}{rest}"
+    return suggestion
+
+# Issue type -> suggestion builder; one hash lookup per issue, and new
+# issue types plug in without touching the loop
+_ISSUE_HANDLERS = {
+    'missing_metrics': _suggest_metrics,
+    'missing_action_verb': _suggest_action_verb,
+    'weak_action_verb': _suggest_verb_replacement,
+}
+
 def improve_bullet(bullet_text, issues):
-    """Generate improvement suggestions for a bullet point"""
+    """Collect improvement suggestions and issue messages for a bullet
+    point in one pass over its issues"""
     suggestions = []
-    
+    messages = []
+
+    # The weak-verb handler needs the first word; extract it once per
+    # bullet instead of re-splitting for every issue
+    match = _FIRST_WORD_RE.match(bullet_text)
+    first_word = match.group(1).lower() if match else ''
+    rest = match.group(2) if match else ''
+
     for issue in issues:
-        if issue['type'] == 'missing_metrics':
-            suggestions.append({
-                'type': 'add_metrics',
-                'suggestion': 'Add specific numbers or percentages',
-                'example': f"{bullet_text} [Add: by X%, reducing costs by $Y, impacting Z users]"
-            })
-        
-        elif issue['type'] == 'missing_action_verb':
-            strong_verbs = ['Implemented', 'Developed', 'Led', 'Designed', 'Built']
-            suggestions.append({
-                'type': 'add_action_verb',
-                'suggestion': f'Start with a strong action verb',
-                'example': f"[Action verb]: {bullet_text}"
-            })
-        
-        elif issue['type'] == 'weak_action_verb':
-            first_word = bullet_text.split()[0].lower() if bullet_text.split() else ''
-            replacements = VERB_IMPROVEMENTS.get(first_word, list(STRONG_ACTION_VERBS)[:3])
-            suggestions.append({
-                'type': 'improve_verb',
-                'suggestion': f'Replace with: {", ".join(replacements)}',
-                'example': f"{replacements[0].capitalize()}{bullet_text[len(first_word):]}"
-            })
-    
-    return suggestions
+        messages.append(issue['message'])
+        handler = _ISSUE_HANDLERS.get(issue['type'])
+        if handler:
+            suggestions.append(handler(bullet_text, first_word, rest))
 
-def generate_improvements(nlp_analysis):
-    """Generate comprehensive improvement suggestions"""
-    improvements = []
-    
+    return suggestions, messages
+
+def _iter_improvements(nlp_analysis):
+    """Yield improvement entries for flawed bullets one at a time, so
+    callers that stream or filter don't hold the whole list"""
     for bullet in nlp_analysis['bullet_points']:
-        if bullet['issues']:
-            bullet_improvements = improve_bullet(bullet['text'], bullet['issues'])
-            
-            improvements.append({
+        issues = bullet['issues']
+        # Blank bullets would only yield misleading '[Action verb]: '
+        # style examples, so they are skipped along with clean ones
+        if issues and bullet['text'].strip():
+            suggestions, messages = improve_bullet(bullet['text'], issues)
+            yield {
                 'original': bullet['text'],
-                'issues': [issue['message'] for issue in bullet['issues']],
-                'suggestions': bullet_improvements
-            })
-    
-    return improvements
+                'issues': messages,
+                'suggestions': suggestions
+            }
+
+def generate_improvements(nlp_analysis):
+    """Generate comprehensive improvement suggestions"""
+    return list(_iter_improvements(nlp_analysis))
+
+# Fixed-content overall suggestions, built once; the threshold checks
+# below only decide whether to append the shared dicts
+_SUGGESTION_METRICS = {
+    'category': 'Quantification',
+    'priority': 'high',
+    'message': 'Add numbers and metrics to more bullet points',
+    'tip': 'Aim for at least 70% of bullets to include quantifiable achievements'
+}
+
+_SUGGESTION_VERBS = {
+    'category': 'Action Verbs',
+    'priority': 'high',
+    'message': 'Use stronger action verbs',
+    'tip': 'Start every bullet with a powerful action verb like Implemented, Led, or Architected'
+}
 
 def generate_overall_suggestions(stats, sections):
     """Generate overall suggestions"""
     suggestions = []
-    
+
     # Metrics suggestions
     if stats['metrics_percentage'] < 70:
-        suggestions.append({
-            'category': 'Quantification',
-            'priority': 'high',
-            'message': 'Add numbers and metrics to more bullet points',
-            'tip': 'Aim for at least 70% of bullets to include quantifiable achievements'
-        })
-    
+        suggestions.append(_SUGGESTION_METRICS)
+
     # Action verb suggestions
     if stats['strong_verbs_percentage'] < 80:
-        suggestions.append({
-            'category': 'Action Verbs',
-            'priority': 'high',
-            'message': 'Use stronger action verbs',
-            'tip': 'Start every bullet with a powerful action verb like Implemented, Led, or Architected'
-        })
-    
-    # Section suggestions
+        suggestions.append(_SUGGESTION_VERBS)
+
+    # Section suggestions (message varies, so this one is built per call)
     if sections['missing']:
         suggestions.append({
             'category': 'Structure',
@@ -96,51 +201,114 @@ def generate_overall_suggestions(stats, sections):
             'message': f"Add missing sections: {', '.join(sections['missing'])}",
             'tip': 'Include Experience, Education, and Skills sections at minimum'
         })
-    
+
     return suggestions
 
-def main():
-    if len(sys.argv) < 2:
-        print(json.dumps({"success": False, "error": "No file path provided"}))
-        sys.exit(1)
-    
-    file_path = sys.argv[1]
-    
+try:
+    import orjson
+
+    def _print_json(obj):
+        """Serialize with orjson and write the bytes straight to stdout"""
+        sys.stdout.buffer.write(orjson.dumps(obj) + b'\n')
+except ImportError:
+    def _print_json(obj):
+        """Stream one JSON object to stdout, skipping the intermediate
+        string a dumps() call would allocate"""
+        json.dump(obj, sys.stdout, separators=(',', ':'))
+        sys.stdout.write('\n')
+
+def process(file_path):
+    """Parse, analyze, and build the improvement result for one file"""
+    # Parse and NLP results are cached by a digest of the uploaded
+    # bytes, so an Analyze followed by an Improve on the same file
+    # only pays for the heavy work once
+    cache_path = None
+    cached = None
     try:
-        # Parse resume
-        if file_path.endswith('.pdf'):
-            parsed = parse_pdf(file_path)
-        elif file_path.endswith('.docx'):
-            parsed = parse_docx(file_path)
-        else:
-            print(json.dumps({"success": False, "error": "Unsupported file type"}))
-            sys.exit(1)
-        
+        with open(file_path, 'rb') as upload:
+            cache_path = _analysis_cache_path(upload.read())
+        with open(cache_path) as cache_file:
+            cached = json.load(cache_file)
+    except (OSError, ValueError, KeyError):
+        cached = None
+
+    if cached is not None:
+        parsed = cached['parsed']
+        nlp_analysis = cached['nlp']
+    else:
+        # Parse resume; the parser and analyzer modules are imported
+        # here so cache hits never pay their import cost
+        parser_name = _PARSERS.get(os.path.splitext(file_path)[1].lower())
+        if parser_name is None:
+            return {"success": False, "error": "Unsupported file type"}
+        import resume_parser
+        parsed = getattr(resume_parser, parser_name)(file_path)
+
         if not parsed['success']:
-            print(json.dumps(parsed))
-            sys.exit(1)
-        
+            return parsed
+
         # Analyze text
+        from nlp_analyzer import analyze_text
         nlp_analysis = analyze_text(parsed['text'])
-        
-        # Generate improvements
-        improvements = generate_improvements(nlp_analysis)
-        overall_suggestions = generate_overall_suggestions(
-            nlp_analysis['statistics'],
-            nlp_analysis['sections']
-        )
-        
-        result = {
-            'success': True,
-            'improvements': improvements,
-            'bulletAnalysis': nlp_analysis['bullet_points'],
-            'overallSuggestions': overall_suggestions
-        }
-        
-        print(json.dumps(result))
-        
+
+        if cache_path is not None:
+            try:
+                tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+                with open(tmp_path, 'w') as cache_file:
+                    json.dump({'parsed': parsed, 'nlp': nlp_analysis}, cache_file)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # caching is best-effort
+
+    # Generate improvements
+    improvements = generate_improvements(nlp_analysis)
+    overall_suggestions = generate_overall_suggestions(
+        nlp_analysis['statistics'],
+        nlp_analysis['sections']
+    )
+
+    return {
+        'success': True,
+        'improvements': improvements,
+        'bulletAnalysis': nlp_analysis['bullet_points'],
+        'overallSuggestions': overall_suggestions
+    }
+
+def _batch():
+    """Batch mode: one file path per stdin line, one JSON result per
+    stdout line, amortizing interpreter startup and imports over many
+    resumes instead of paying them per invocation"""
+    for line in sys.stdin:
+        path = line.strip()
+        if not path:
+            continue
+        try:
+            result = process(path)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        _print_json(result)
+        sys.stdout.flush()
+
+def main():
+    args = sys.argv[1:]
+
+    if '--batch' in args:
+        _batch()
+        return
+
+    paths = [arg for arg in args if not arg.startswith('--')]
+    if not paths:
+        _print_json({"success": False, "error": "No file path provided"})
+        sys.exit(1)
+
+    try:
+        result = process(paths[0])
     except Exception as e:
-        print(json.dumps({"success": False, "error": str(e)}))
+        _print_json({"success": False, "error": str(e)})
+        sys.exit(1)
+
+    _print_json(result)
+    if not result.get('success'):
         sys.exit(1)
 
 if __name__ == "__main__":